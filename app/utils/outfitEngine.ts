@@ -318,34 +318,35 @@ function getTodayString() {
   return new Date().toISOString().split("T")[0];
 }
 
+const COLOR_ALIASES: Record<string, ClothingColor> = {
+  black: "black",
+  white: "white",
+  grey: "grey",
+  gray: "grey",
+  navy: "navy",
+  blue: "blue",
+  "dark blue": "navy",
+  khaki: "khaki",
+  tan: "camel",
+  camel: "camel",
+  beige: "beige",
+  brown: "brown",
+  green: "green",
+  "dark green": "green",
+  olive: "olive",
+  red: "red",
+  burgundy: "burgundy",
+  maroon: "burgundy",
+  cream: "cream",
+  charcoal: "charcoal",
+  "dark grey": "charcoal",
+  "dark gray": "charcoal",
+};
+
 function normalizeColor(c: any): ClothingColor {
   if (!c) return "unknown";
   const s = String(c).toLowerCase().trim();
-  const MAP: Record<string, ClothingColor> = {
-    black: "black",
-    white: "white",
-    grey: "grey",
-    gray: "grey",
-    navy: "navy",
-    blue: "blue",
-    "dark blue": "navy",
-    khaki: "khaki",
-    tan: "camel",
-    camel: "camel",
-    beige: "beige",
-    brown: "brown",
-    green: "green",
-    "dark green": "green",
-    olive: "olive",
-    red: "red",
-    burgundy: "burgundy",
-    maroon: "burgundy",
-    cream: "cream",
-    charcoal: "charcoal",
-    "dark grey": "charcoal",
-    "dark gray": "charcoal",
-  };
-  return MAP[s] || "unknown";
+  return COLOR_ALIASES[s] || "unknown";
 }
 
 function inferBottomType(category: string, name: string): BottomType {
@@ -410,28 +411,27 @@ function getEmojiForCat(cat: string): string {
   return "👕";
 }
 
+// Keyword sets compiled once; each test is a single substring scan.
+const TOP_CAT_RE = /shirt|tshirt|top|sweater|jacket|coat/;
+const BOTTOM_CAT_RE = /pant|jean|trouser|bottom|short|skirt/;
+const FOOTWEAR_CAT_RE = /shoe|sneaker|boot|sandal|loafer/;
+const OUTERWEAR_CAT_RE = /jacket|coat|outerwear/;
+const ACCESSORY_CAT_RE = /accessory|cap|hat|bag|belt|watch/;
+
 function isTopCat(cat: string) {
-  return ["shirt", "tshirt", "top", "sweater", "jacket", "coat"].some((k) =>
-    cat.includes(k),
-  );
+  return TOP_CAT_RE.test(cat);
 }
 function isBottomCat(cat: string) {
-  return ["pant", "jean", "trouser", "bottom", "short", "skirt"].some((k) =>
-    cat.includes(k),
-  );
+  return BOTTOM_CAT_RE.test(cat);
 }
 function isFootwearCat(cat: string) {
-  return ["shoe", "sneaker", "boot", "sandal", "loafer"].some((k) =>
-    cat.includes(k),
-  );
+  return FOOTWEAR_CAT_RE.test(cat);
 }
 function isOuterwearCat(cat: string) {
-  return ["jacket", "coat", "outerwear"].some((k) => cat.includes(k));
+  return OUTERWEAR_CAT_RE.test(cat);
 }
 function isAccessoryCat(cat: string) {
-  return ["accessory", "cap", "hat", "bag", "belt", "watch"].some((k) =>
-    cat.includes(k),
-  );
+  return ACCESSORY_CAT_RE.test(cat);
 }
 
 export function buildWardrobeFromItems(items: any[]): Wardrobe {
@@ -0,0 +1,63 @@
+#!/usr/bin/env node
+
+/**
+ * Fires concurrent vector-file removals at one wardrobe_vectors file, the way
+ * the wardrobe multi-select delete does, and checks every removed vector is
+ * gone afterwards (no lost updates, no leftover temp files).
+ * Run with: node ./scripts/check-concurrent-vector-delete.js
+ */
+
+const assert = require("assert");
+const fs = require("fs");
+const os = require("os");
+const path = require("path");
+const { updateJsonFile } = require("../server/services/fileStore");
+
+// Same filter the DELETE /api/profile/wardrobe/:userId/item/:itemId route runs.
+function removeVector(vectorPath, filename) {
+  return updateJsonFile(vectorPath, (vectors) => {
+    const rows = Array.isArray(vectors) ? vectors : [];
+    const filtered = rows.filter(
+      (v) =>
+        !String(v.image_path || "")
+          .replace(/\\/g, "/")
+          .endsWith(filename),
+    );
+    return filtered.length !== rows.length ? filtered : undefined;
+  });
+}
+
+async function main() {
+  const dir = fs.mkdtempSync(path.join(os.tmpdir(), "wardrobe-vectors-"));
+  const vectorPath = path.join(dir, "user_1.json");
+  const names = ["tshirt_1.png", "jeans_1.png", "shoes_1.png", "cap_1.png"];
+  fs.writeFileSync(
+    vectorPath,
+    JSON.stringify(
+      names.map((n) => ({ image_path: `wardrobe/user_1/images/${n}`, vector: [0.1, 0.2] })),
+    ),
+  );
+
+  try {
+    const deleted = names.slice(0, 3);
+    await Promise.all(deleted.map((n) => removeVector(vectorPath, n)));
+
+    const remaining = JSON.parse(fs.readFileSync(vectorPath, "utf8"));
+    assert.deepStrictEqual(
+      remaining.map((v) => path.basename(v.image_path)),
+      ["cap_1.png"],
+    );
+    assert.deepStrictEqual(
+      fs.readdirSync(dir).filter((f) => f.endsWith(".tmp")),
+      [],
+    );
+    console.log(`ok: ${deleted.length} concurrent removals, 1 vector left`);
+  } finally {
+    fs.rmSync(dir, { recursive: true, force: true });
+  }
+}
+
+main().catch((err) => {
+  console.error(err);
+  process.exit(1);
+});
@@ -15,6 +15,7 @@ const { processPost } = require("./services/createPostPipeline");
 const { getForYouFeed } = require("./services/recommendationService");
 const { processPostVectorPipeline } = require("./services/postVectorPipeline");
 const { toggleLike, getUserLikes } = require("./services/likeService");
+const { writeFileAtomic } = require("./services/fileStore");
 
 const PORT = process.env.PORT || 4000;
 const app = express();
@@ -163,6 +164,16 @@ const SERVER_DIR = __dirname;
 const REPO_OUTFIT = path.join(SERVER_DIR, "outfit_model");
 const OUTFIT_PORT = parseInt(process.env.OUTFIT_PORT || "8000", 10);
 const OUTFIT_API_URL = `http://127.0.0.1:${OUTFIT_PORT}`;
+// uvicorn's "auto" picks uvloop + httptools when they are installed in the
+// model venv; set these to "uvloop"/"httptools" to fail fast if they are not.
+const OUTFIT_UVICORN_LOOP = process.env.OUTFIT_UVICORN_LOOP || "auto";
+const OUTFIT_UVICORN_HTTP = process.env.OUTFIT_UVICORN_HTTP || "auto";
+// Keep a single worker unless the model API's job store is shared: /job/:id
+// polling only works against the worker that accepted the upload.
+const OUTFIT_WORKERS = Math.max(
+  1,
+  parseInt(process.env.OUTFIT_WORKERS || "1", 10) || 1,
+);
 const CLERK_API_BASE = "https://api.clerk.com/v1";
 
 // Enable CORS for local dev clients (Expo web/native + localhost ports).
@@ -365,6 +376,12 @@ async function startOutfitModel() {
       "127.0.0.1",
       "--port",
       String(OUTFIT_PORT),
+      "--loop",
+      OUTFIT_UVICORN_LOOP,
+      "--http",
+      OUTFIT_UVICORN_HTTP,
+      "--workers",
+      String(OUTFIT_WORKERS),
     ],
     { cwd: REPO_OUTFIT, env, stdio: ["ignore", "pipe", "pipe"] },
   );
@@ -396,7 +413,11 @@ async function startOutfitModel() {
       }, 1500);
     }
   });
-  console.log("[outfit] Model API starting on port", OUTFIT_PORT);
+  console.log(
+    "[outfit] Model API starting on port",
+    OUTFIT_PORT,
+    `(workers=${OUTFIT_WORKERS})`,
+  );
 }
 
 function waitForOutfit(timeoutMs = 60000) {
@@ -483,17 +504,19 @@ app.post("/api/outfit-analysis", upload.single("image"), async (req, res) => {
         .json({ error: errText || "outfit analysis failed" });
     }
     const result = await response.json();
+    // Write result.json off the event loop; it is a debug artifact and must
+    // not hold up this response. Overlapping requests each rename a complete
+    // temp file into place, so the file is never mixed or truncated.
     const resultsDir = path.join(SERVER_DIR, "results");
-    try {
-      fs.mkdirSync(resultsDir, { recursive: true });
-      fs.writeFileSync(
-        path.join(resultsDir, "result.json"),
-
-        JSON.stringify(result, null, 2),
-      );
-    } catch (e) {
-      console.warn("Could not write result.json:", e.message);
-    }
+    fs.promises
+      .mkdir(resultsDir, { recursive: true })
+      .then(() =>
+        writeFileAtomic(
+          path.join(resultsDir, "result.json"),
+          JSON.stringify(result, null, 2),
+        ),
+      )
+      .catch((e) => console.warn("Could not write result.json:", e.message));
     res.json(result);
   } catch (err) {
     console.error("outfit-analysis error", err);
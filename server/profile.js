@@ -4,6 +4,10 @@ const express = require("express");
 const FormData = require("form-data");
 const multer = require("multer");
 const { createClient } = require("@supabase/supabase-js");
+const {
+  writeFileAtomicSync,
+  updateJsonFile,
+} = require("./services/fileStore");
 
 const router = express.Router();
 
@@ -141,7 +145,6 @@ function normalizeClerkUser(clerkUser) {
     bio: null,
   };
   
-  console.log(`[normalizeClerkUser] Normalized profile:`, normalized);
   return normalized;
 }
 
@@ -149,7 +152,7 @@ function writeFollowsStore(rows) {
   try {
     const dir = path.dirname(FOLLOWS_STORE_PATH);
     fs.mkdirSync(dir, { recursive: true });
-    fs.writeFileSync(FOLLOWS_STORE_PATH, JSON.stringify(rows, null, 2), "utf8");
+    writeFileAtomicSync(FOLLOWS_STORE_PATH, JSON.stringify(rows));
   } catch (e) {
     console.warn("[follows-store] write error:", e.message);
   }
@@ -181,7 +184,7 @@ function removeFollowFallback(followerId, followingId) {
         String(r.following_clerk_id) === String(followingId)
       ),
   );
-  writeFollowsStore(filtered);
+  if (filtered.length !== rows.length) writeFollowsStore(filtered);
 }
 
 function isFollowingFallback(followerId, followingId) {
@@ -250,10 +253,10 @@ function formDataToBuffer(form) {
   });
 }
 
-const bucketFor = (cat) => {
-  const c = String(cat || "").toLowerCase();
-  if (
-    [
+// Category -> wardrobe bucket, built once at load; unknown categories land in tshirts.
+const WARDROBE_BUCKETS = new Map(
+  Object.entries({
+    tshirts: [
       "tshirt",
       "shirt",
       "top",
@@ -263,19 +266,17 @@ const bucketFor = (cat) => {
       "coat",
       "hoodie",
       "blouse",
-    ].includes(c)
-  )
-    return "tshirts";
-  if (["pants", "jeans", "trouser", "trousers", "shorts", "skirt"].includes(c))
-    return "jeans";
-  if (["shoes", "shoe", "sneaker", "sneakers", "boot", "boots"].includes(c))
-    return "shoes";
-  if (c === "watch") return "watches";
-  if (["cap", "hat"].includes(c)) return "caps";
-  if (c === "bag") return "bags";
-  if (c === "belt") return "caps";
-  return "tshirts";
-};
+    ],
+    jeans: ["pants", "jeans", "trouser", "trousers", "shorts", "skirt"],
+    shoes: ["shoes", "shoe", "sneaker", "sneakers", "boot", "boots"],
+    watches: ["watch"],
+    caps: ["cap", "hat", "belt"],
+    bags: ["bag"],
+  }).flatMap(([bucket, cats]) => cats.map((c) => [c, bucket])),
+);
+
+const bucketFor = (cat) =>
+  WARDROBE_BUCKETS.get(String(cat || "").toLowerCase()) || "tshirts";
 
 // ---------------------------------------------------------------------------
 // POST /api/profile/upload-wardrobe
@@ -471,9 +472,10 @@ router.delete("/wardrobe/:userId/item/:itemId", async (req, res) => {
         // Convert /static/... URL to absolute path
         const staticMatch = imageUrl.match(/\/static\/(.+)$/);
         if (staticMatch) absPath = path.join(OUTFIT_MODEL_DIR, staticMatch[1]);
-        if (fs.existsSync(absPath)) fs.unlinkSync(absPath);
+        await fs.promises.unlink(absPath);
       } catch (e) {
-        console.warn("could not delete image file (non-fatal):", e.message);
+        if (e.code !== "ENOENT")
+          console.warn("could not delete image file (non-fatal):", e.message);
       }
     }
 
@@ -485,23 +487,26 @@ router.delete("/wardrobe/:userId/item/:itemId", async (req, res) => {
       "wardrobe_vectors",
       `${userId}.json`,
     );
-    if (fs.existsSync(vectorPath)) {
+    // Updates to the same user's file are serialized: multi-select delete
+    // sends these requests in parallel.
+    const filename = imageUrl
+      ? path.basename(imageUrl.replace(/\\/g, "/"))
+      : null;
+    if (filename) {
       try {
-        const vectors = JSON.parse(fs.readFileSync(vectorPath, "utf8")) || [];
-        const filename = imageUrl
-          ? path.basename(imageUrl.replace(/\\/g, "/"))
-          : null;
-        const filtered = filename
-          ? vectors.filter(
-              (v) =>
-                !String(v.image_path || "")
-                  .replace(/\\/g, "/")
-                  .endsWith(filename),
-            )
-          : vectors;
-        fs.writeFileSync(vectorPath, JSON.stringify(filtered, null, 2), "utf8");
+        await updateJsonFile(vectorPath, (vectors) => {
+          const rows = Array.isArray(vectors) ? vectors : [];
+          const filtered = rows.filter(
+            (v) =>
+              !String(v.image_path || "")
+                .replace(/\\/g, "/")
+                .endsWith(filename),
+          );
+          return filtered.length !== rows.length ? filtered : undefined;
+        });
       } catch (e) {
-        console.warn("could not update vector file (non-fatal):", e.message);
+        if (e.code !== "ENOENT")
+          console.warn("could not update vector file (non-fatal):", e.message);
       }
     }
 
@@ -516,7 +521,7 @@ router.delete("/wardrobe/:userId/item/:itemId", async (req, res) => {
 // ---------------------------------------------------------------------------
 // GET /api/profile/segmented/:userId
 // ---------------------------------------------------------------------------
-router.get("/segmented/:userId", (req, res) => {
+router.get("/segmented/:userId", async (req, res) => {
   try {
     const { userId } = req.params;
     if (!/^[\w-]+$/.test(userId))
@@ -527,11 +532,16 @@ router.get("/segmented/:userId", (req, res) => {
       "uploads",
       `${userId}_segmented`,
     );
-    if (!fs.existsSync(segDir)) return res.json({ success: true, items: [] });
+    // A single readdir; a missing directory just means nothing segmented yet.
+    let entries;
+    try {
+      entries = await fs.promises.readdir(segDir);
+    } catch (e) {
+      if (e.code === "ENOENT") return res.json({ success: true, items: [] });
+      throw e;
+    }
 
-    const files = fs
-      .readdirSync(segDir)
-      .filter((f) => /\.(png|jpe?g|webp)$/i.test(f));
+    const files = entries.filter((f) => /\.(png|jpe?g|webp)$/i.test(f));
     const nodeBase = `${req.protocol}://${req.get("host")}`;
     const items = files.map((file) => {
       const name = path.parse(file).name;
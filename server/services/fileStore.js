@@ -0,0 +1,74 @@
+const fs = require("fs");
+const path = require("path");
+const crypto = require("crypto");
+
+// Small helpers for the JSON files the server keeps on local disk
+// (follows fallback, wardrobe vectors, result.json).
+
+// Write through a uniquely named sibling temp file and rename it into place,
+// so a crash, a concurrent reader or an overlapping writer never sees a
+// half-written file.
+function tmpPathFor(filePath) {
+  return `${filePath}.${crypto.randomBytes(6).toString("hex")}.tmp`;
+}
+
+function writeFileAtomicSync(filePath, data) {
+  const tmpPath = tmpPathFor(filePath);
+  try {
+    fs.writeFileSync(tmpPath, data, "utf8");
+    fs.renameSync(tmpPath, filePath);
+  } catch (e) {
+    fs.rmSync(tmpPath, { force: true });
+    throw e;
+  }
+}
+
+async function writeFileAtomic(filePath, data) {
+  const tmpPath = tmpPathFor(filePath);
+  try {
+    await fs.promises.writeFile(tmpPath, data, "utf8");
+    await fs.promises.rename(tmpPath, filePath);
+  } catch (e) {
+    await fs.promises.rm(tmpPath, { force: true });
+    throw e;
+  }
+}
+
+// Tail of the pending update chain for each file path.
+const updateQueues = new Map();
+
+/**
+ * Read-modify-write a JSON file, one update per path at a time.
+ * Without this, two requests that both await between read and write each
+ * start from the same original contents and the last rename drops the
+ * other's change.
+ * @param {string} filePath - JSON file to update
+ * @param {(data: any) => any} update - Returns the new contents, or
+ *   undefined to leave the file untouched
+ * @returns {Promise<boolean>} Whether the file was rewritten
+ */
+function updateJsonFile(filePath, update) {
+  const key = path.resolve(filePath);
+  const run = async () => {
+    const data = JSON.parse(await fs.promises.readFile(key, "utf8"));
+    const next = update(data);
+    if (next === undefined) return false;
+    await writeFileAtomic(key, JSON.stringify(next));
+    return true;
+  };
+
+  const prev = updateQueues.get(key) || Promise.resolve();
+  const result = prev.then(run);
+  const tail = result.catch(() => {});
+  updateQueues.set(key, tail);
+  tail.then(() => {
+    if (updateQueues.get(key) === tail) updateQueues.delete(key);
+  });
+  return result;
+}
+
+module.exports = {
+  writeFileAtomic,
+  writeFileAtomicSync,
+  updateJsonFile,
+};